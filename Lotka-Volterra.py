@@ -1,32 +1,117 @@
 import dash
 import flask
 from dash import dcc, html
-from dash.dependencies import Input, Output, State
-import plotly.graph_objs as go
+from dash.dependencies import Input, Output, State, ClientsideFunction
+import plotly.io as pio
 import numpy as np
-from scipy.integrate import odeint
+from numba import njit
+from functools import lru_cache
 import os
 
-# Define the Lotka-Volterra equations
-def lotka_volterra(state, t, alpha, beta, gamma, delta):
-    x, y = state
-    dxdt = alpha * x - beta * x * y
-    dydt = -gamma * y + delta * x * y
-    return [dxdt, dydt]
+# Integration grid: trajectory over t in [0, T_MAX] sampled at N_POINTS.
+# The time axis is a pure constant, so build it once instead of per solve.
+T_MAX = 10.0
+N_POINTS = 100
+# Internal RK4 substeps between consecutive output samples: a single step of
+# dt~0.1 is unstable at the slider extremes (large alpha*x terms) and blows
+# up to Inf/NaN, so each output interval is integrated in N_SUBSTEPS pieces
+N_SUBSTEPS = 5
+_T = np.linspace(0, T_MAX, N_POINTS)
+_T.setflags(write=False)
+_DT = float(_T[1] - _T[0])
+
+# Fixed-step RK4 integrator for the Lotka-Volterra equations, compiled with
+# Numba so each slider/click callback avoids Python-level derivative calls
+@njit(cache=True, fastmath=True, boundscheck=False, error_model='numpy')
+def _rk4(x0, y0, alpha, beta, gamma, delta, n, substeps, dt, out_x, out_y):
+    x, y = x0, y0
+    out_x[0] = x
+    out_y[0] = y
+    h = dt / substeps
+    for i in range(1, n):
+        for s in range(substeps):
+            # Each stage shares one x*y product between both derivatives
+            xy = x * y
+            k1x = alpha * x - beta * xy
+            k1y = -gamma * y + delta * xy
+            x2 = x + 0.5 * h * k1x
+            y2 = y + 0.5 * h * k1y
+            xy = x2 * y2
+            k2x = alpha * x2 - beta * xy
+            k2y = -gamma * y2 + delta * xy
+            x3 = x + 0.5 * h * k2x
+            y3 = y + 0.5 * h * k2y
+            xy = x3 * y3
+            k3x = alpha * x3 - beta * xy
+            k3y = -gamma * y3 + delta * xy
+            x4 = x + h * k3x
+            y4 = y + h * k3y
+            xy = x4 * y4
+            k4x = alpha * x4 - beta * xy
+            k4y = -gamma * y4 + delta * xy
+            x = x + h / 6.0 * (k1x + 2.0 * k2x + 2.0 * k3x + k4x)
+            y = y + h / 6.0 * (k1y + 2.0 * k2y + 2.0 * k3y + k4y)
+        out_x[i] = x
+        out_y[i] = y
+
+# Prefer the ahead-of-time build (python _build_rk4.py) when present, so a
+# fresh worker skips JIT compilation on first import; otherwise the @njit
+# version above compiles on the warm-up call and is cached on disk
+try:
+    from lv_rk4 import rk4 as _rk4
+except ImportError:
+    pass
+
+# Memoized solver: slider steps are discrete, so identical parameter tuples
+# recur constantly (slider wiggles, clickData replays). Arrays are marked
+# read-only so a cached result can't be mutated by a caller.
+@lru_cache(maxsize=512)
+def _solve_cached(x0, y0, alpha, beta, gamma, delta):
+    prey = np.empty(N_POINTS)
+    predators = np.empty(N_POINTS)
+    _rk4(x0, y0, alpha, beta, gamma, delta, N_POINTS, N_SUBSTEPS, _DT, prey, predators)
+    for arr in (prey, predators):
+        # 3 decimals is below pixel resolution and cuts the JSON text roughly
+        # in half versus full float64 reprs
+        np.round(arr, 3, out=arr)
+        arr.setflags(write=False)
+    return _T, prey, predators
 
 # Solve the system and return the trajectory
 def solve_lotka_volterra(initial_conditions, alpha, beta, gamma, delta):
-    t = np.linspace(0, 10, 100)
-    solution = odeint(lotka_volterra, initial_conditions, t, args=(alpha, beta, gamma, delta))
-    return t, solution[:, 0], solution[:, 1]  # time, prey, predators
+    # Round each parameter just enough to make cache keys exact: one decimal
+    # past the slider step, so the default delta of 0.075 survives intact
+    return _solve_cached(round(initial_conditions[0], 2), round(initial_conditions[1], 2),
+                         round(alpha, 2), round(beta, 3), round(gamma, 2), round(delta, 3))
+
+# Warm the JIT cache at import (and seed the memo for the default view)
+solve_lotka_volterra([10.0, 5.0], 1.0, 0.1, 1.5, 0.075)
 
 # Initialize Dash app
 server = flask.Flask(__name__)
 app = dash.Dash(__name__, server=server)
 
+# Serialize callback responses with orjson; Dash picks this up via plotly
+pio.json.config.default_engine = 'orjson'
+
 # Default initial conditions
 DEFAULT_INITIAL_CONDITIONS = [10.0, 5.0]
 
+# Slider marks, computed once and shared where the ranges coincide (alpha
+# and gamma): building them inline with np.arange allocated arrays per
+# slider and printed numpy scalars instead of plain floats
+_RATE_MARKS = {v: str(v) for v in (0.1, 0.5, 1.0, 1.5, 2.0)}  # alpha, gamma
+_BETA_MARKS = {v: str(v) for v in (0.01, 0.1, 0.2, 0.3, 0.4, 0.5)}
+_DELTA_MARKS = {v: str(v) for v in (0.01, 0.05, 0.1, 0.15, 0.2)}
+
+# Animation: the trajectory itself is static once integrated and lives in
+# the base figure, so only the Current State marker is animated. Each
+# interval tick extends that trace by one point with max_points=1, which
+# moves the marker along the orbit without retransmitting any arrays.
+ANIMATION_STEP = 5
+ANIMATION_INTERVAL_MS = 100
+_CURRENT_STATE_TRACE = 3  # index of the Current State marker in the figure
+
 # App layout
 app.layout = html.Div([
     html.Div([
@@ -34,145 +119,91 @@ app.layout = html.Div([
         dcc.Markdown(r'$$\begin{align} \frac{dx}{dt} &= \alpha x - \beta x y \\ \frac{dy}{dt} &= -\gamma y + \delta x y \end{align}$$',mathjax=True),
     ], style={'width': '90%', 'padding': '20px', 'text-align': 'center'}),
     dcc.Graph(id='phase-plot', style={'width': 'auto', 'min-width': '80%', 'height': '800px', 'aspectRatio': '2/1'}),
+    html.Div([
+        html.Button('Play', id='play-button', n_clicks=0),
+        html.Button('Pause', id='pause-button', n_clicks=0)
+    ], style={'width': '90%', 'padding': '10px', 'text-align': 'center'}),
     html.Div([
         html.Label("α (Prey Growth Rate):"),
-        dcc.Slider(id='alpha-slider', min=0.1, max=2.0, step=0.1, value=1.0), #, marks={i: str(i) for i in np.arange(0.1, 2.1, 0.5)}
+        dcc.Slider(id='alpha-slider', min=0.1, max=2.0, step=0.1, value=1.0, marks=_RATE_MARKS),
         html.Label("β (Predation Rate):"),
-        dcc.Slider(id='beta-slider', min=0.01, max=0.5, step=0.01, value=0.1), #, marks={i: str(i) for i in np.arange(0.01, 0.51, 0.1)}
+        dcc.Slider(id='beta-slider', min=0.01, max=0.5, step=0.01, value=0.1, marks=_BETA_MARKS),
         html.Label("γ (Predator Death Rate):"),
-        dcc.Slider(id='gamma-slider', min=0.1, max=2.0, step=0.1, value=1.5), #, marks={i: str(i) for i in np.arange(0.1, 2.1, 0.5)}
+        dcc.Slider(id='gamma-slider', min=0.1, max=2.0, step=0.1, value=1.5, marks=_RATE_MARKS),
         html.Label("δ (Predator Growth Rate):"),
-        dcc.Slider(id='delta-slider', min=0.01, max=0.2, step=0.01, value=0.075) #, marks={i: str(i) for i in np.arange(0.01, 0.21, 0.05)}
+        dcc.Slider(id='delta-slider', min=0.01, max=0.2, step=0.01, value=0.075, marks=_DELTA_MARKS)
     ], style={'width': '90%', 'padding': '20px'}),
-    dcc.Store(id='initial-conditions-store', data=DEFAULT_INITIAL_CONDITIONS)  # Store for initial conditions
+    dcc.Store(id='initial-conditions-store', data=DEFAULT_INITIAL_CONDITIONS),  # Store for initial conditions
+    dcc.Store(id='animation-index', data=0),  # Next trajectory point to append
+    dcc.Interval(id='animation-interval', interval=ANIMATION_INTERVAL_MS, n_intervals=0, disabled=True)
 ])
 
-# Callback to update the graph based on sliders and clicks
-@app.callback(
+# Clientside callback: the figure (trajectory, streamlines, click grid) is
+# built entirely in the browser by the RK4 in assets/lv.js, so slider drags
+# and new initial conditions never pay a server round-trip. It also rewinds
+# and stops the animation, since a fresh figure resets the animated trace.
+app.clientside_callback(
+    ClientsideFunction(namespace='lv', function_name='update'),
     [Output('phase-plot', 'figure'),
-     Output('initial-conditions-store', 'data')],
+     Output('animation-index', 'data', allow_duplicate=True),
+     Output('animation-interval', 'disabled', allow_duplicate=True)],
     [
         Input('alpha-slider', 'value'),
         Input('beta-slider', 'value'),
         Input('gamma-slider', 'value'),
         Input('delta-slider', 'value'),
-        Input('phase-plot', 'clickData')
+        Input('initial-conditions-store', 'data')
     ],
-    [State('initial-conditions-store', 'data')]
+    prevent_initial_call='initial_duplicate'
 )
-def update_graph(alpha, beta, gamma, delta, click_data, current_initial_conditions):
-    # Update initial conditions if a click occurred
+
+# Callback to update the initial conditions when the plot is clicked.
+# prevent_initial_call stops the load-time run with clickData=None, and
+# no_update keeps an empty click from rewriting the store — every store
+# write triggers a clientside figure rebuild, so spurious writes cost a
+# full re-render.
+@app.callback(
+    Output('initial-conditions-store', 'data'),
+    [Input('phase-plot', 'clickData')],
+    prevent_initial_call=True
+)
+def set_initial_conditions(click_data):
     if click_data:
-        initial_conditions = [click_data['points'][0]['x'], click_data['points'][0]['y']]
-    else:
-        initial_conditions = current_initial_conditions
-    
-    # Solve the system
+        return [click_data['points'][0]['x'], click_data['points'][0]['y']]
+    return dash.no_update
+
+# Callback to start/stop the animation clock
+@app.callback(
+    Output('animation-interval', 'disabled'),
+    [Input('play-button', 'n_clicks'),
+     Input('pause-button', 'n_clicks')],
+    prevent_initial_call=True
+)
+def toggle_animation(play_clicks, pause_clicks):
+    return dash.callback_context.triggered_id == 'pause-button'
+
+# Callback to move the Current State marker to the next trajectory point.
+# Repeat solves here are free: the parameters hit the lru_cache.
+@app.callback(
+    [Output('phase-plot', 'extendData'),
+     Output('animation-index', 'data'),
+     Output('animation-interval', 'disabled', allow_duplicate=True)],
+    [Input('animation-interval', 'n_intervals')],
+    [State('alpha-slider', 'value'),
+     State('beta-slider', 'value'),
+     State('gamma-slider', 'value'),
+     State('delta-slider', 'value'),
+     State('initial-conditions-store', 'data'),
+     State('animation-index', 'data')],
+    prevent_initial_call=True
+)
+def animate(n_intervals, alpha, beta, gamma, delta, initial_conditions, index):
+    if index >= N_POINTS:
+        # Orbit complete: rewind and stop the clock
+        return dash.no_update, 0, True
     t, prey, predators = solve_lotka_volterra(initial_conditions, alpha, beta, gamma, delta)
-    
-    # Create the Plotly figure
-    fig = go.Figure()
-
-    # Add invisible grid points for precise selection (reduced grid density)
-    x_max = 100
-    y_max = 50
-    x_grid = np.linspace(0, x_max, 25)
-    y_grid = np.linspace(0, y_max, 25)
-    X_grid, Y_grid = np.meshgrid(x_grid, y_grid)
-
-    fig.add_trace(go.Scatter(
-        x=X_grid.flatten(),
-        y=Y_grid.flatten(),
-        mode='markers',
-        marker=dict(color='rgba(0,0,0,0)', size=1),
-        showlegend=False
-    ))
-
-    # Create frames for animation (reduced number of frames)
-    frames = []
-    for i in range(0, len(t), 5):  # Step by 5 to reduce number of frames
-        frames.append(go.Frame(
-            data=[
-                go.Scatter(
-                    x=prey[:i+1],
-                    y=predators[:i+1],
-                    mode='lines',#+markers
-                    name='Trajectory',
-                    line=dict(color='blue'),
-                    marker=dict(color='blue', size=4)
-                ),
-                go.Scatter(
-                    x=[prey[i]],
-                    y=[predators[i]],
-                    mode='markers',
-                    name='Current State',
-                    marker=dict(color='green', size=8)
-                ),
-                go.Scatter(
-                    x=X_grid.flatten(),
-                    y=Y_grid.flatten(),
-                    mode='markers',
-                    marker=dict(color='rgba(0,0,0,0)', size=1),
-                    showlegend=False
-                )
-            ]
-        ))
-
-    # Add initial trajectory trace
-    fig.add_trace(go.Scatter(
-        x=prey,
-        y=predators,
-        mode='lines',
-        name='Trajectory',
-        line=dict(color='blue', width=1)
-    ))
-    
-    # Add initial condition point
-    fig.add_trace(go.Scatter(
-        x=[initial_conditions[0]],
-        y=[initial_conditions[1]],
-        mode='markers',
-        name='Initial Condition',
-        marker=dict(color='red', size=10)
-    ))
-    
-    # Update layout with animation settings
-    fig.update_layout(
-        # title='Lotka-Volterra Phase Space',
-        margin={"t": 5},
-        xaxis_title='Prey Population',
-        yaxis_title='Predator Population',
-        showlegend=False,
-        xaxis=dict(range=[0, x_max]),
-        yaxis=dict(range=[0, y_max]),
-        updatemenus=[dict(
-            type="buttons",
-            showactive=False,
-            buttons=[dict(
-                label="Play",
-                method="animate",
-                args=[None, {"frame": {"duration": 100, "redraw": False}, "fromcurrent": True}]  # Increased duration, disabled redraw
-            ),
-            dict(
-                label="Pause",
-                method="animate",
-                args=[[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate", "transition": {"duration": 0}}]
-            )]
-        )],
-        clickmode='event+select',
-        dragmode='select'
-    )
-    
-    # Set frames for animation
-    fig.frames = frames
-    
-    # Add click event handler
-    fig.update_traces(
-        hoveron='points',
-        hovertext='Click to set new initial condition'
-    )
-    
-    return fig, initial_conditions
+    extend = [{"x": [[prey[index]]], "y": [[predators[index]]]}, [_CURRENT_STATE_TRACE], 1]
+    return extend, index + ANIMATION_STEP, dash.no_update
 
 # Run the app
 if __name__ == '__main__':
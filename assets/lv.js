@@ -0,0 +1,158 @@
+// Clientside figure builder: solves the Lotka-Volterra system with the same
+// fixed-step RK4 as the Python module and rebuilds the phase plot entirely
+// in the browser, so slider drags never pay a server round-trip.
+// Constants mirror Lotka-Volterra.py: keep the two files in sync.
+
+(function () {
+    var T_MAX = 10.0;
+    var N_POINTS = 100;
+    // Internal RK4 substeps between output samples; one dt~0.1 step is
+    // unstable at the slider extremes (see N_SUBSTEPS in Lotka-Volterra.py)
+    var N_SUBSTEPS = 5;
+    var DT = T_MAX / (N_POINTS - 1);
+    var H = DT / N_SUBSTEPS;
+    var X_MAX = 100;
+    var Y_MAX = 50;
+
+    // Invisible click-target grid (25 x 25), built once at load
+    var GRID_X = [];
+    var GRID_Y = [];
+    for (var j = 0; j < 25; j++) {
+        for (var i = 0; i < 25; i++) {
+            GRID_X.push(i * (X_MAX / 24));
+            GRID_Y.push(j * (Y_MAX / 24));
+        }
+    }
+
+    // Starting points for the phase-portrait streamlines (4 x 3 grid)
+    var STREAM_X0 = [];
+    var STREAM_Y0 = [];
+    for (var sj = 0; sj < 3; sj++) {
+        for (var si = 0; si < 4; si++) {
+            STREAM_X0.push(10.0 + si * (80.0 / 3));
+            STREAM_Y0.push(10.0 + sj * 15.0);
+        }
+    }
+
+    // Fixed-step RK4 for one initial condition; appends onto outX/outY
+    function rk4(x0, y0, alpha, beta, gamma, delta, outX, outY) {
+        var x = x0;
+        var y = y0;
+        outX.push(x);
+        outY.push(y);
+        for (var i = 1; i < N_POINTS; i++) {
+            for (var s = 0; s < N_SUBSTEPS; s++) {
+                // Each stage shares one x*y product between both derivatives
+                var xy = x * y;
+                var k1x = alpha * x - beta * xy;
+                var k1y = -gamma * y + delta * xy;
+                var x2 = x + 0.5 * H * k1x;
+                var y2 = y + 0.5 * H * k1y;
+                xy = x2 * y2;
+                var k2x = alpha * x2 - beta * xy;
+                var k2y = -gamma * y2 + delta * xy;
+                var x3 = x + 0.5 * H * k2x;
+                var y3 = y + 0.5 * H * k2y;
+                xy = x3 * y3;
+                var k3x = alpha * x3 - beta * xy;
+                var k3y = -gamma * y3 + delta * xy;
+                var x4 = x + H * k3x;
+                var y4 = y + H * k3y;
+                xy = x4 * y4;
+                var k4x = alpha * x4 - beta * xy;
+                var k4y = -gamma * y4 + delta * xy;
+                x = x + H / 6.0 * (k1x + 2.0 * k2x + 2.0 * k3x + k4x);
+                y = y + H / 6.0 * (k1y + 2.0 * k2y + 2.0 * k3y + k4y);
+            }
+            outX.push(x);
+            outY.push(y);
+        }
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        lv: {
+            update: function (alpha, beta, gamma, delta, initialConditions) {
+                // Main trajectory
+                var prey = [];
+                var predators = [];
+                rk4(initialConditions[0], initialConditions[1],
+                    alpha, beta, gamma, delta, prey, predators);
+
+                // Phase-portrait streamlines as one null-separated pair
+                var streamX = [];
+                var streamY = [];
+                for (var k = 0; k < STREAM_X0.length; k++) {
+                    rk4(STREAM_X0[k], STREAM_Y0[k],
+                        alpha, beta, gamma, delta, streamX, streamY);
+                    streamX.push(null);
+                    streamY.push(null);
+                }
+
+                var hovertext = 'Click to set new initial condition';
+                var figure = {
+                    data: [
+                        {
+                            type: 'scattergl',
+                            x: GRID_X,
+                            y: GRID_Y,
+                            mode: 'markers',
+                            marker: {color: 'rgba(0,0,0,0)', size: 1},
+                            showlegend: false,
+                            hoveron: 'points',
+                            hovertext: hovertext
+                        },
+                        {
+                            type: 'scattergl',
+                            x: streamX,
+                            y: streamY,
+                            mode: 'lines',
+                            name: 'Streamlines',
+                            line: {color: 'rgba(120,120,120,0.25)', width: 1},
+                            hoverinfo: 'skip',
+                            showlegend: false
+                        },
+                        {
+                            type: 'scattergl',
+                            x: prey,
+                            y: predators,
+                            mode: 'lines',
+                            name: 'Trajectory',
+                            line: {color: 'blue', width: 1},
+                            hoveron: 'points',
+                            hovertext: hovertext
+                        },
+                        {
+                            type: 'scattergl',
+                            x: [initialConditions[0]],
+                            y: [initialConditions[1]],
+                            mode: 'markers',
+                            name: 'Current State',
+                            marker: {color: 'green', size: 8}
+                        },
+                        {
+                            type: 'scattergl',
+                            x: [initialConditions[0]],
+                            y: [initialConditions[1]],
+                            mode: 'markers',
+                            name: 'Initial Condition',
+                            marker: {color: 'red', size: 10},
+                            hoveron: 'points',
+                            hovertext: hovertext
+                        }
+                    ],
+                    layout: {
+                        margin: {t: 5},
+                        xaxis: {title: 'Prey Population', range: [0, X_MAX]},
+                        yaxis: {title: 'Predator Population', range: [0, Y_MAX]},
+                        showlegend: false,
+                        clickmode: 'event+select',
+                        dragmode: 'select'
+                    }
+                };
+
+                // A fresh figure resets the animated trace: rewind and stop
+                return [figure, 0, true];
+            }
+        }
+    });
+})();